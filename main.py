@@ -8,25 +8,71 @@ For educational purposes only; not medical advice.
 
 from __future__ import annotations
 import math
+from bisect import bisect_right
 import typing as t
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import altair as alt
+
+if t.TYPE_CHECKING:
+    import altair as alt
 
 
 # ----------------------------- Constants -----------------------------
 APP_TITLE = "BMI Calculator"
 APP_SUBTITLE = "Body Mass Index — Educational Tool"
-
-# Thresholds: (label, lower_bound_inclusive, upper_bound_exclusive, color)
-BMI_BANDS: t.List[t.Tuple[str, float, float, str]] = [
-    ("Underweight", 0.0, 18.5, "#1976D2"),  # blue
-    ("Normal", 18.5, 25.0, "#2E7D32"),      # green
-    ("Overweight", 25.0, 30.0, "#ED6C02"),  # amber
-    ("Obese", 30.0, float("inf"), "#C62828")# red
-]
+_TITLE_HTML = (
+    f"<div class='title-bar'><h1 style='margin:0'>{APP_TITLE}</h1>"
+    f"<p style='margin:0.25rem 0 0;color:#334155'>{APP_SUBTITLE}</p></div>"
+)
+
+# BMI bands as parallel tuples (label, start inclusive, end exclusive, color, badge tone).
+# Outer edges are capped to the chart display domain.
+_LABELS: t.Tuple[str, ...] = ("Underweight", "Normal", "Overweight", "Obese")
+_STARTS: t.Tuple[float, ...] = (10.0, 18.5, 25.0, 30.0)
+_ENDS: t.Tuple[float, ...] = (18.5, 25.0, 30.0, 40.0)
+_COLORS: t.Tuple[str, ...] = ("#1976D2", "#2E7D32", "#ED6C02", "#C62828")  # blue, green, amber, red
+_TONES: t.Tuple[str, ...] = ("info", "ok", "warn", "alert")
+
+# Unit conversion factors folded into BMI (kg/m²)
+_KG_CM2_TO_BMI = 10000.0
+_LB_IN2_TO_BMI = 0.45359237 / (0.0254 ** 2)  # ≈ 703.07
+
+# Chart display domain — capped to a sensible range for context
+CHART_MIN, CHART_MAX = _STARTS[0], _ENDS[-1]
+
+# Classifier lookup: upper bounds (exclusive) and the (category, tone) for each band
+_BMI_CUTS: t.Tuple[float, ...] = _STARTS[1:]
+_BMI_LABELS: t.Tuple[t.Tuple[str, str], ...] = tuple(zip(_LABELS, _TONES))
+
+# Recommendations per category (built once at import)
+_RECS: t.Dict[str, t.Tuple[str, ...]] = {
+    "Underweight": (
+        "Discuss weight goals with a clinician or dietitian.",
+        "Increase nutrient-dense calories; emphasize lean proteins and complex carbs.",
+        "Screen for underlying causes (e.g., thyroid, malabsorption).",
+        "Incorporate progressive resistance training."
+    ),
+    "Normal": (
+        "Maintain balanced diet per evidence-based guidelines.",
+        "Target ≥150 minutes/week of moderate activity.",
+        "Prioritize sleep hygiene and stress management.",
+        "Continue routine preventive care."
+    ),
+    "Overweight": (
+        "Adopt calorie-aware, whole-food eating patterns.",
+        "Increase physical activity; combine aerobic and strength training.",
+        "Set incremental goals (e.g., 5–7% weight reduction).",
+        "Consider coaching or registered dietitian support."
+    ),
+    "Obese": (
+        "Partner with a clinician for a comprehensive plan.",
+        "Combine nutrition therapy, activity, and behavior strategies.",
+        "Discuss adjuncts when appropriate (pharmacotherapy, bariatric referral).",
+        "Address comorbidities (HTN, T2DM, OSA) and monitor regularly."
+    ),
+    "—": ()
+}
+_EMPTY: t.Tuple[str, ...] = ()
 
 CSS = """
 <style>
@@ -95,82 +141,72 @@ def bmi(weight_kg: float, height_m: float) -> float:
     return weight_kg / (height_m ** 2)
 
 
+def bmi_metric(weight_kg: float, height_cm: float) -> float:
+    """BMI straight from kg and cm. Returns NaN if inputs invalid."""
+    if height_cm <= 0 or weight_kg <= 0:
+        return float("nan")
+    return weight_kg * _KG_CM2_TO_BMI / (height_cm * height_cm)
+
+
+def bmi_imperial(weight_lb: float, height_in: float) -> float:
+    """BMI straight from lbs and inches. Returns NaN if inputs invalid."""
+    if height_in <= 0 or weight_lb <= 0:
+        return float("nan")
+    return weight_lb * _LB_IN2_TO_BMI / (height_in * height_in)
+
+
 def classify_bmi(bmi_value: float) -> t.Tuple[str, str]:
     """Return (category, tone) for badge styling."""
-    if math.isnan(bmi_value):
+    if bmi_value != bmi_value:  # NaN
         return "—", "info"
-    if bmi_value < 18.5:
-        return "Underweight", "info"
-    if bmi_value < 25.0:
-        return "Normal", "ok"
-    if bmi_value < 30.0:
-        return "Overweight", "warn"
-    return "Obese", "alert"
-
-
-def recommendations(category: str) -> t.List[str]:
-    recs = {
-        "Underweight": [
-            "Discuss weight goals with a clinician or dietitian.",
-            "Increase nutrient-dense calories; emphasize lean proteins and complex carbs.",
-            "Screen for underlying causes (e.g., thyroid, malabsorption).",
-            "Incorporate progressive resistance training."
-        ],
-        "Normal": [
-            "Maintain balanced diet per evidence-based guidelines.",
-            "Target ≥150 minutes/week of moderate activity.",
-            "Prioritize sleep hygiene and stress management.",
-            "Continue routine preventive care."
-        ],
-        "Overweight": [
-            "Adopt calorie-aware, whole-food eating patterns.",
-            "Increase physical activity; combine aerobic and strength training.",
-            "Set incremental goals (e.g., 5–7% weight reduction).",
-            "Consider coaching or registered dietitian support."
-        ],
-        "Obese": [
-            "Partner with a clinician for a comprehensive plan.",
-            "Combine nutrition therapy, activity, and behavior strategies.",
-            "Discuss adjuncts when appropriate (pharmacotherapy, bariatric referral).",
-            "Address comorbidities (HTN, T2DM, OSA) and monitor regularly."
-        ],
-        "—": []
-    }
-    return recs.get(category, [])
+    return _BMI_LABELS[bisect_right(_BMI_CUTS, bmi_value)]
 
 
-def render_band_chart(bmi_value: float) -> alt.Chart:
-    """Color-coded range bars + current BMI marker."""
-    # Chart ranges
-    # Cap the display domain to a sensible range for context
-    display_min, display_max = 10.0, 40.0
+def recommendations(category: str) -> t.Tuple[str, ...]:
+    return _RECS.get(category, _EMPTY)
 
-    thresholds = pd.DataFrame({
-        "range": ["Underweight", "Normal", "Overweight", "Obese"],
-        "start": [10.0, 18.5, 25.0, 30.0],
-        "end":   [18.5, 25.0, 30.0, 40.0],
-        "color": ["#1976D2", "#2E7D32", "#ED6C02", "#C62828"]
-    })
 
-    point_val = float(np.clip(bmi_value if not math.isnan(bmi_value) else 0, display_min, display_max))
-    point = pd.DataFrame({"BMI": [point_val]})
+@st.cache_resource
+def _band_base_chart() -> alt.Chart:
+    """Static color-coded range bars; built once per process and reused across reruns."""
+    import altair as alt
+    import pandas as pd
 
-    base = (
+    thresholds = pd.DataFrame(
+        {"range": _LABELS, "start": _STARTS, "end": _ENDS, "color": _COLORS},
+        copy=False
+    )
+
+    return (
         alt.Chart(thresholds)
         .mark_bar()
         .encode(
-            x=alt.X("start:Q", scale=alt.Scale(domain=[display_min, display_max]),
+            x=alt.X("start:Q", scale=alt.Scale(domain=[CHART_MIN, CHART_MAX]),
                     axis=alt.Axis(title="BMI (kg/m²)")),
             x2="end:Q",
-            color=alt.Color("range:N", scale=alt.Scale(range=thresholds["color"].tolist()), legend=None),
+            color=alt.Color("range:N", scale=alt.Scale(domain=list(_LABELS), range=list(_COLORS)), legend=None),
             tooltip=["range", "start", "end"]
         )
         .properties(height=44)
     )
 
+
+def render_band_chart(bmi_value: float) -> alt.Chart:
+    """Color-coded range bars + current BMI marker."""
+    import altair as alt
+    import pandas as pd
+
+    if bmi_value != bmi_value or bmi_value < CHART_MIN:  # NaN or below range
+        point_val = CHART_MIN
+    elif bmi_value > CHART_MAX:
+        point_val = CHART_MAX
+    else:
+        point_val = float(bmi_value)
+    point = pd.DataFrame({"BMI": [point_val]}, copy=False)
+
     marker = alt.Chart(point).mark_tick(size=44, thickness=2).encode(x="BMI:Q")
 
-    return base + marker
+    return _band_base_chart() + marker
 
 
 # ----------------------------- Streamlit App -----------------------------
@@ -179,11 +215,7 @@ def main() -> None:
     st.markdown(CSS, unsafe_allow_html=True)
 
     # Title
-    st.markdown(
-        f"<div class='title-bar'><h1 style='margin:0'>{APP_TITLE}</h1>"
-        f"<p style='margin:0.25rem 0 0;color:#334155'>{APP_SUBTITLE}</p></div>",
-        unsafe_allow_html=True
-    )
+    st.markdown(_TITLE_HTML, unsafe_allow_html=True)
 
     # Sidebar — Units & Guidance
     with st.sidebar:
@@ -208,8 +240,7 @@ def main() -> None:
             weight_kg = st.number_input(
                 "Weight (kg)", min_value=20.0, max_value=300.0, value=70.0, step=0.1
             )
-        height_m = height_cm / 100.0
-        weight = weight_kg
+        raw_bmi = bmi_metric(weight_kg, height_cm)
     else:
         with col1:
             height_in = st.number_input(
@@ -219,11 +250,10 @@ def main() -> None:
             weight_lb = st.number_input(
                 "Weight (lbs)", min_value=44.0, max_value=660.0, value=154.0, step=0.1
             )
-        height_m = meters_from_inches(height_in)
-        weight = kg_from_lbs(weight_lb)
+        raw_bmi = bmi_imperial(weight_lb, height_in)
 
     # Compute
-    bmi_value = round(bmi(weight, height_m), 1) if height_m > 0 and weight > 0 else float("nan")
+    bmi_value = round(raw_bmi, 1)
     category, tone = classify_bmi(bmi_value)
 
     # Results